@@ -1,7 +1,94 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import List, Dict
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterator, List, Dict
+
+import streamlit as st
+from openai import APIConnectionError, APITimeoutError, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+
+# Streamlit runs each session in its own thread (and asyncio.run gives each
+# call a fresh loop), so the limiter uses thread primitives, not asyncio ones.
+class RequestLimiter:
+    def __init__(self, max_concurrency: int, requests_per_minute: float) -> None:
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._rate = max(requests_per_minute, 1.0) / 60.0
+        self._capacity = float(max(1, max_concurrency))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def pace(self) -> None:
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def apace(self) -> None:
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    # slot() only bounds concurrency; every attempt made while holding it
+    # calls pace()/apace() so retries are charged against the rate too.
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self._slots.acquire()
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        acquire = asyncio.ensure_future(asyncio.to_thread(self._slots.acquire))
+        try:
+            await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            # The worker thread still takes the slot; hand it back once it does.
+            acquire.add_done_callback(lambda _: self._slots.release())
+            raise
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+
+_LIMITER = RequestLimiter(
+    max_concurrency=int(os.getenv("OPENAI_CONCURRENCY", "8")),
+    requests_per_minute=float(os.getenv("OPENAI_RPM", "500")),
+)
+
+# tenacity is the only retry layer, so the SDK's own retries are disabled
+# on the clients below and each attempt is bounded by this timeout.
+_REQUEST_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "20"))
+
+_retry_transient = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=1, min=1, max=30),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError)),
+    reraise=True,
+)
+
+
+def _with_system(system_prompt: str, messages: List[Dict]) -> List[Dict]:
+    history: List[Dict] = [{"role": "system", "content": system_prompt}]
+    history.extend(messages)
+    return history
 
 
 class RuleBasedLLM:
@@ -13,29 +100,83 @@ class RuleBasedLLM:
             return "We will schedule interviews based on your fit. Please ensure your details are complete."
         return "I can assist with hiring and tech-screening questions. Could you clarify your query?"
 
+    def stream(self, system_prompt: str, messages: List[Dict]) -> Iterator[str]:
+        yield self.chat(system_prompt, messages)
+
 
 class OpenAILLM:
     def __init__(self) -> None:
         from openai import OpenAI
 
-        self.client = OpenAI()
+        self.client = OpenAI(max_retries=0, timeout=_REQUEST_TIMEOUT)
+
+    @_retry_transient
+    def _call(self, history: List[Dict], stream: bool = False) -> Any:
+        _LIMITER.pace()
+        return self.client.chat.completions.create(
+            model=os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
+            messages=history,
+            temperature=0.2,
+            max_tokens=400,
+            stream=stream,
+        )
 
     def chat(self, system_prompt: str, messages: List[Dict]) -> str:
-        history = [
-            {"role": "system", "content": system_prompt},
-        ] + messages
+        history = _with_system(system_prompt, messages)
+        try:
+            with _LIMITER.slot():
+                resp = self._call(history)
+            return resp.choices[0].message.content.strip()
+        except Exception:
+            return RuleBasedLLM().chat(system_prompt, messages)
+
+    def stream(self, system_prompt: str, messages: List[Dict]) -> Iterator[str]:
+        history = _with_system(system_prompt, messages)
+        emitted = False
+        try:
+            # Hold the slot until the stream is drained: the request is in
+            # flight for as long as chunks are still arriving.
+            with _LIMITER.slot():
+                for chunk in self._call(history, stream=True):
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        emitted = True
+                        yield delta
+        except Exception:
+            pass
+        if not emitted:
+            yield from RuleBasedLLM().stream(system_prompt, messages)
+
+
+class AsyncOpenAILLM:
+    def __init__(self) -> None:
+        from openai import AsyncOpenAI
+
+        self.client = AsyncOpenAI(max_retries=0, timeout=_REQUEST_TIMEOUT)
+
+    @_retry_transient
+    async def _call(self, history: List[Dict]) -> Any:
+        await _LIMITER.apace()
+        return await self.client.chat.completions.create(
+            model=os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
+            messages=history,
+            temperature=0.2,
+            max_tokens=400,
+        )
+
+    async def chat(self, system_prompt: str, messages: List[Dict]) -> str:
+        history = _with_system(system_prompt, messages)
         try:
-            resp = self.client.chat.completions.create(
-                model=os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
-                messages=history,
-                temperature=0.2,
-                max_tokens=400,
-            )
+            async with _LIMITER.aslot():
+                resp = await self._call(history)
             return resp.choices[0].message.content.strip()
         except Exception:
             return RuleBasedLLM().chat(system_prompt, messages)
 
 
+@st.cache_resource
 def get_llm_client():
     if os.getenv("OPENAI_API_KEY"):
         return OpenAILLM()
@@ -2,26 +2,65 @@ from __future__ import annotations
 
 import os
 import json
+import threading
 import time
 import uuid
 from typing import List, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(payload: Any, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _dumps_line(payload: Dict[str, Any]) -> bytes:
+    return dumps_json(payload) + b"\n"
+
 
 class LocalJSONStore:
     def __init__(self, base_dir: str = "app/data") -> None:
         self.base_dir = base_dir
         os.makedirs(self.base_dir, exist_ok=True)
+        self.path = os.path.join(self.base_dir, "conversations.jsonl")
+        self._fh = open(self.path, "ab", buffering=1 << 16)
+        self._lock = threading.Lock()
 
-    def save_conversation(self, profile: Dict[str, Any], messages: List[Dict[str, Any]], questions: List[Dict[str, Any]]) -> str:
-        payload = {
+    @staticmethod
+    def _payload(profile: Dict[str, Any], messages: List[Dict[str, Any]], questions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
             "id": str(uuid.uuid4()),
             "ts": int(time.time()),
             "profile": profile,
             "messages": messages,
             "questions": questions,
         }
-        fname = f"{payload['ts']}_{payload['id']}.json"
-        path = os.path.join(self.base_dir, fname)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-        return path
+
+    def _append(self, data: bytes) -> None:
+        with self._lock:
+            self._fh.write(data)
+            self._fh.flush()
+
+    def save_conversation(self, profile: Dict[str, Any], messages: List[Dict[str, Any]], questions: List[Dict[str, Any]]) -> str:
+        self._append(_dumps_line(self._payload(profile, messages, questions)))
+        return self.path
+
+    def save_batch(self, items: List[Dict[str, Any]]) -> str:
+        data = b"".join(
+            _dumps_line(self._payload(item["profile"], item["messages"], item["questions"]))
+            for item in items
+        )
+        if data:
+            self._append(data)
+        return self.path
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
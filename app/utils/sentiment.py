@@ -1,31 +1,180 @@
 from __future__ import annotations
 
-from typing import Literal
+import logging
+import os
+from functools import lru_cache
+from typing import Dict, List, Literal
 
 import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
+from nltk.sentiment.vader import VaderConstants
 
 
-_analyzer: SentimentIntensityAnalyzer | None = None
+logger = logging.getLogger(__name__)
 
+NLTK_DATA_DIR = os.getenv("NLTK_DATA_DIR", "/usr/local/nltk_data")
+if NLTK_DATA_DIR not in nltk.data.path:
+    nltk.data.path.insert(0, NLTK_DATA_DIR)
 
-def _ensure_vader() -> SentimentIntensityAnalyzer:
-    global _analyzer
-    if _analyzer is None:
+VADER_LEXICON = "sentiment/vader_lexicon.zip/vader_lexicon/vader_lexicon.txt"
+
+# VADER's word lists and scalars (boosters, negations, idioms); reused so the
+# dict-based scorer below applies the same rules as SentimentIntensityAnalyzer.
+_VADER = VaderConstants()
+
+
+def _load_lexicon() -> Dict[str, float]:
+    try:
+        raw = nltk.data.load(VADER_LEXICON, format="text")
+    except LookupError:
+        # Lexicon was not pre-installed at build time; fetch it once here so
+        # the cost lands on process start rather than a user's first answer.
+        nltk.download("vader_lexicon", quiet=True)
         try:
-            _analyzer = SentimentIntensityAnalyzer()
+            raw = nltk.data.load(VADER_LEXICON, format="text")
         except LookupError:
-            nltk.download("vader_lexicon", quiet=True)
-            _analyzer = SentimentIntensityAnalyzer()
-    return _analyzer
+            logger.warning("VADER lexicon unavailable; sentiment will be reported as neutral")
+            return {}
+    lexicon: Dict[str, float] = {}
+    for line in raw.splitlines():
+        parts = line.split("\t", 2)
+        if len(parts) >= 2:
+            lexicon[parts[0]] = float(parts[1])
+    return lexicon
+
+
+_LEXICON = _load_lexicon()
+
+
+def _tokenize(text: str) -> List[str]:
+    # Mirrors SentiText: drop single characters and strip one leading or
+    # trailing punctuation run from words, keeping emoticons and contractions.
+    words_only = {w for w in _VADER.REGEX_REMOVE_PUNCTUATION.sub("", text).split() if len(w) > 1}
+    tokens: List[str] = []
+    for token in text.split():
+        if len(token) <= 1:
+            continue
+        for p in _VADER.PUNC_LIST:
+            if token.endswith(p) and token[: -len(p)] in words_only:
+                token = token[: -len(p)]
+                break
+            if token.startswith(p) and token[len(p):] in words_only:
+                token = token[len(p):]
+                break
+        tokens.append(token)
+    return tokens
+
+
+def _never_check(valence: float, tokens: List[str], start_i: int, i: int) -> float:
+    if start_i == 0:
+        if _VADER.negated([tokens[i - 1]]):
+            valence *= _VADER.N_SCALAR
+    elif start_i == 1:
+        if tokens[i - 2] == "never" and tokens[i - 1] in ("so", "this"):
+            valence *= 1.5
+        elif _VADER.negated([tokens[i - 2]]):
+            valence *= _VADER.N_SCALAR
+    elif start_i == 2:
+        if (tokens[i - 3] == "never" and tokens[i - 2] in ("so", "this")) or tokens[i - 1] in ("so", "this"):
+            valence *= 1.25
+        elif _VADER.negated([tokens[i - 3]]):
+            valence *= _VADER.N_SCALAR
+    return valence
+
+
+def _idioms_check(valence: float, tokens: List[str], i: int) -> float:
+    idioms = _VADER.SPECIAL_CASE_IDIOMS
+    onezero = f"{tokens[i - 1]} {tokens[i]}"
+    twoonezero = f"{tokens[i - 2]} {tokens[i - 1]} {tokens[i]}"
+    twoone = f"{tokens[i - 2]} {tokens[i - 1]}"
+    threetwoone = f"{tokens[i - 3]} {tokens[i - 2]} {tokens[i - 1]}"
+    threetwo = f"{tokens[i - 3]} {tokens[i - 2]}"
+    for seq in (onezero, twoonezero, twoone, threetwoone, threetwo):
+        if seq in idioms:
+            valence = idioms[seq]
+            break
+    if len(tokens) - 1 > i:
+        zeroone = f"{tokens[i]} {tokens[i + 1]}"
+        if zeroone in idioms:
+            valence = idioms[zeroone]
+    if len(tokens) - 1 > i + 1:
+        zeroonetwo = f"{tokens[i]} {tokens[i + 1]} {tokens[i + 2]}"
+        if zeroonetwo in idioms:
+            valence = idioms[zeroonetwo]
+    if threetwo in _VADER.BOOSTER_DICT or twoone in _VADER.BOOSTER_DICT:
+        valence += _VADER.B_DECR
+    return valence
 
 
+def _least_check(valence: float, lowered: List[str], i: int) -> float:
+    if i > 0 and lowered[i - 1] == "least" and lowered[i - 1] not in _LEXICON:
+        if i == 1 or lowered[i - 2] not in ("at", "very"):
+            valence *= _VADER.N_SCALAR
+    return valence
+
+
+def _valence(tokens: List[str], lowered: List[str], i: int, is_cap_diff: bool) -> float:
+    item = tokens[i]
+    valence = _LEXICON.get(lowered[i])
+    if valence is None:
+        return 0.0
+    if item.isupper() and is_cap_diff:
+        valence += _VADER.C_INCR if valence > 0 else -_VADER.C_INCR
+    for start_i in range(3):
+        if i > start_i and lowered[i - (start_i + 1)] not in _LEXICON:
+            scalar = _VADER.scalar_inc_dec(tokens[i - (start_i + 1)], valence, is_cap_diff)
+            if start_i == 1:
+                scalar *= 0.95
+            elif start_i == 2:
+                scalar *= 0.9
+            valence += scalar
+            valence = _never_check(valence, tokens, start_i, i)
+            if start_i == 2:
+                valence = _idioms_check(valence, tokens, i)
+    return _least_check(valence, lowered, i)
+
+
+def _compound(text: str) -> float:
+    tokens = _tokenize(text)
+    if not tokens:
+        return 0.0
+    lowered = [t.lower() for t in tokens]
+    allcaps = sum(1 for t in tokens if t.isupper())
+    is_cap_diff = 0 < len(tokens) - allcaps < len(tokens)
+
+    sentiments: List[float] = []
+    for i, low in enumerate(lowered):
+        if low in _VADER.BOOSTER_DICT or (low == "kind" and i < len(lowered) - 1 and lowered[i + 1] == "of"):
+            sentiments.append(0.0)
+        else:
+            sentiments.append(_valence(tokens, lowered, i, is_cap_diff))
+
+    if "but" in lowered:
+        bi = lowered.index("but")
+        sentiments = [
+            v * 0.5 if idx < bi else v * 1.5 if idx > bi else v
+            for idx, v in enumerate(sentiments)
+        ]
+
+    total = sum(sentiments)
+    if not total:
+        return 0.0
+    emphasis = min(text.count("!"), 4) * 0.292
+    qm_count = text.count("?")
+    if qm_count > 1:
+        emphasis += qm_count * 0.18 if qm_count <= 3 else 0.96
+    total += emphasis if total > 0 else -emphasis
+    return _VADER.normalize(total)
+
+
+@lru_cache(maxsize=1024)
 def analyze_sentiment_label(text: str) -> Literal["positive", "neutral", "negative"]:
-    analyzer = _ensure_vader()
-    scores = analyzer.polarity_scores(text)
-    compound = scores.get("compound", 0.0)
+    t = text.strip()
+    if len(t) < 2 or not any(c.isalpha() for c in t):
+        return "neutral"
+    compound = _compound(t)
     if compound >= 0.2:
         return "positive"
     if compound <= -0.2:
         return "negative"
     return "neutral"
+
@@ -1,44 +1,64 @@
 from __future__ import annotations
 
-from typing import List, Set
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, Tuple
 
 import phonenumbers
 from email_validator import validate_email, EmailNotValidError
 from pydantic import BaseModel, field_validator
 
 
-END_WORDS_DEFAULT: Set[str] = {"quit", "exit", "bye", "goodbye", "stop", "end"}
+END_WORDS_DEFAULT: FrozenSet[str] = frozenset({"quit", "exit", "bye", "goodbye", "stop", "end"})
 
+ALIASES: Mapping[str, str] = MappingProxyType({
+    "js": "javascript",
+    "py": "python",
+    "ts": "typescript",
+    "pgsql": "postgresql",
+    "postgre": "postgresql",
+    "mongo": "mongodb",
+    "tf": "tensorflow",
+    "sklearn": "scikit-learn",
+})
 
-def is_end_keyword(text: str, end_words: Set[str] | None = None) -> bool:
-    words = end_words or END_WORDS_DEFAULT
-    return text.strip().lower() in words
+
+@lru_cache(maxsize=256)
+def is_end_keyword(text: str, end_words: FrozenSet[str] = END_WORDS_DEFAULT) -> bool:
+    return text.strip().lower() in end_words
+
+
+_SEPARATORS = str.maketrans({"/": ",", "|": ","})
+_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
+@lru_cache(maxsize=256)
+def _parse_tech_stack(raw: str) -> Tuple[str, ...]:
+    tokens = _SPLIT_RE.split(raw.translate(_SEPARATORS).strip().lower())
+    return tuple(dict.fromkeys(ALIASES.get(t, t) for t in tokens if t))
 
 
 def parse_tech_stack(raw: str) -> List[str]:
-    items = [
-        token.strip().lower()
-        for token in raw.replace("/", ",").replace("|", ",").split(",")
-        if token.strip()
-    ]
-    aliases = {
-        "js": "javascript",
-        "py": "python",
-        "ts": "typescript",
-        "pgsql": "postgresql",
-        "postgre": "postgresql",
-        "mongo": "mongodb",
-        "tf": "tensorflow",
-        "sklearn": "scikit-learn",
-    }
-    normalized = [aliases.get(x, x) for x in items]
-    seen: set[str] = set()
-    result: List[str] = []
-    for x in normalized:
-        if x not in seen:
-            seen.add(x)
-            result.append(x)
-    return result
+    return list(_parse_tech_stack(raw))
+
+
+@lru_cache(maxsize=256)
+def valid_email(text: str) -> bool:
+    try:
+        validate_email(text.strip(), check_deliverability=False)
+        return True
+    except EmailNotValidError:
+        return False
+
+
+@lru_cache(maxsize=256)
+def valid_phone(text: str) -> bool:
+    try:
+        parsed = phonenumbers.parse(text.strip(), None)
+        return phonenumbers.is_valid_number(parsed)
+    except Exception:
+        return False
 
 
 class CandidateProfile(BaseModel):
@@ -95,8 +115,12 @@ class CandidateProfile(BaseModel):
         return cls(**data)
 
     def is_complete_minimal(self) -> bool:
-        try:
-            _ = CandidateProfile(**self.model_dump())
-            return True
-        except Exception:
-            return False
+        # Field validators already ran when this instance was built; only
+        # check that every field was supplied and text fields are non-blank.
+        for name in type(self).model_fields:
+            if name not in self.model_fields_set:
+                return False
+            value = getattr(self, name)
+            if isinstance(value, str) and not value.strip():
+                return False
+        return True
@@ -1,8 +1,5 @@
 import os
-import json
-import csv
-from io import StringIO
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List
 
 import streamlit as st
 from dotenv import load_dotenv
@@ -11,20 +8,27 @@ from app.utils.validators import (
     CandidateProfile,
     parse_tech_stack,
     is_end_keyword,
+    END_WORDS_DEFAULT,
+    valid_email,
+    valid_phone,
 )
 from app.utils.questions import generate_question_set
-from app.storage.store import LocalJSONStore
+from app.storage.store import LocalJSONStore, dumps_json
 from app.utils.sentiment import analyze_sentiment_label
 from app.llm.client import get_llm_client
 
-from email_validator import validate_email, EmailNotValidError
-import phonenumbers
-
 
 load_dotenv()
 
 APP_TITLE = "TalentScout - Hiring Assistant"
-END_KEYWORDS = {"quit", "exit", "bye", "goodbye", "stop", "end"}
+SYSTEM_PROMPT = (
+    "You are a hiring assistant for a tech recruitment agency. Keep answers concise,"
+    " stay within hiring and tech-screening topics only. If asked unrelated questions,"
+    " politely refuse and redirect to hiring-related topics."
+)
+RECENT_MESSAGES = 4
+# Roughly 512 tokens at ~4 characters per token.
+SUMMARY_CHAR_BUDGET = 2048
 
 
 def init_state() -> None:
@@ -40,6 +44,22 @@ def init_state() -> None:
         st.session_state.ended = False
     if "question_count" not in st.session_state:
         st.session_state.question_count = 5
+    if "next_q" not in st.session_state:
+        st.session_state.next_q = 0
+    if "parsed_techs" not in st.session_state:
+        st.session_state.parsed_techs = None
+    if "profile_ver" not in st.session_state:
+        st.session_state.profile_ver = 0
+    if "questions_ver" not in st.session_state:
+        st.session_state.questions_ver = 0
+    if "export_cache" not in st.session_state:
+        st.session_state.export_cache: Dict[str, Any] = {}
+    if "profile_obj" not in st.session_state:
+        st.session_state.profile_obj = None
+    if "history_summary" not in st.session_state:
+        st.session_state.history_summary = ""
+    if "summarized_upto" not in st.session_state:
+        st.session_state.summarized_upto = 0
 
 
 def add_message(role: str, content: str) -> None:
@@ -61,25 +81,16 @@ def greeting_block() -> None:
 
 
 def render_chat() -> None:
-    for m in st.session_state.messages:
+    messages = st.session_state.messages
+    for m in messages[st.session_state.rendered_upto:]:
         with st.chat_message(m["role"]):
             st.write(m["content"])
+    st.session_state.rendered_upto = len(messages)
 
 
-def _valid_email(text: str) -> bool:
-    try:
-        validate_email(text.strip(), check_deliverability=False)
-        return True
-    except EmailNotValidError:
-        return False
-
-
-def _valid_phone(text: str) -> bool:
-    try:
-        parsed = phonenumbers.parse(text.strip(), None)
-        return phonenumbers.is_valid_number(parsed)
-    except Exception:
-        return False
+def _set_profile_field(key: str, value: str) -> None:
+    st.session_state.profile[key] = value
+    st.session_state.profile_ver += 1
 
 
 def collect_candidate_info(user_input: str) -> str:
@@ -89,19 +100,19 @@ def collect_candidate_info(user_input: str) -> str:
     if "full_name" not in profile:
         if len(text) < 3:
             return "Please provide your full name (at least 3 characters)."
-        profile["full_name"] = text
+        _set_profile_field("full_name", text)
         return "Great, please share your email address."
 
     if "email" not in profile:
-        if not _valid_email(text):
+        if not valid_email(text):
             return "That doesn't look like a valid email. Please re-enter your email."
-        profile["email"] = text
+        _set_profile_field("email", text)
         return "Thanks! What's your phone number (with country code if possible)?"
 
     if "phone" not in profile:
-        if not _valid_phone(text):
+        if not valid_phone(text):
             return "That phone number seems invalid. Please include country code if possible."
-        profile["phone"] = text
+        _set_profile_field("phone", text)
         return "How many years of experience do you have? (e.g., 2, 3.5)"
 
     if "years_experience" not in profile:
@@ -109,7 +120,7 @@ def collect_candidate_info(user_input: str) -> str:
             years_val = float(text)
             if years_val < 0 or years_val > 60:
                 return "Please enter years of experience between 0 and 60."
-            profile["years_experience"] = text
+            _set_profile_field("years_experience", text)
         except Exception:
             return "Please enter a number for years of experience (e.g., 2, 3.5)."
         return "What's your desired position(s)?"
@@ -117,13 +128,13 @@ def collect_candidate_info(user_input: str) -> str:
     if "desired_positions" not in profile:
         if len(text) < 2:
             return "Please specify at least one desired position."
-        profile["desired_positions"] = text
+        _set_profile_field("desired_positions", text)
         return "What's your current location (City, Country)?"
 
     if "location" not in profile:
         if len(text) < 2:
             return "Please provide your current location (City, Country)."
-        profile["location"] = text
+        _set_profile_field("location", text)
         return (
             "Please list your tech stack (languages, frameworks, databases, tools)."
             " For example: Python, Django, PostgreSQL, Docker"
@@ -133,7 +144,8 @@ def collect_candidate_info(user_input: str) -> str:
         techs = parse_tech_stack(text)
         if not techs:
             return "I couldn't parse that. Please list comma-separated technologies (e.g., Python, React)."
-        profile["tech_stack"] = ", ".join(techs)
+        _set_profile_field("tech_stack", ", ".join(techs))
+        st.session_state.parsed_techs = techs
         return "Would you like to consent to storing your data locally for screening? (yes/no)"
 
     if not st.session_state.consent:
@@ -144,54 +156,109 @@ def collect_candidate_info(user_input: str) -> str:
 
 
 def maybe_finalize_profile() -> CandidateProfile | None:
-    if not st.session_state.profile:
-        return None
-    try:
-        return CandidateProfile.from_raw(st.session_state.profile)
-    except Exception:
-        return None
+    ver = st.session_state.profile_ver
+    cached = st.session_state.profile_obj
+    if cached is not None and cached[0] == ver:
+        return cached[1]
+    profile: CandidateProfile | None = None
+    # collect_candidate_info validates each field as it is entered, so only
+    # build the model (and run its validators) once the last field lands.
+    if all(name in st.session_state.profile for name in CandidateProfile.model_fields):
+        try:
+            profile = CandidateProfile.from_raw(st.session_state.profile)
+        except Exception:
+            profile = None
+    st.session_state.profile_obj = (ver, profile)
+    return profile
+
+
+def _parsed_techs(profile: CandidateProfile) -> List[str]:
+    if st.session_state.parsed_techs is None:
+        st.session_state.parsed_techs = parse_tech_stack(profile.tech_stack)
+    return st.session_state.parsed_techs
 
 
 def ask_technical_questions(profile: CandidateProfile) -> List[Dict[str, Any]]:
-    techs = parse_tech_stack(profile.tech_stack)
+    techs = _parsed_techs(profile)
     questions = generate_question_set(techs, total_questions=st.session_state.question_count)
     return questions
 
 
+@st.cache_resource
+def get_store() -> LocalJSONStore:
+    return LocalJSONStore(base_dir="app/data")
+
+
 def end_conversation_block(profile: CandidateProfile | None) -> None:
     add_message(
         "assistant",
         "Thank you for your time. Our team will review your responses and reach out with next steps."
     )
     st.session_state.ended = True
-    store = LocalJSONStore(base_dir="app/data")
     if st.session_state.consent and profile is not None:
+        store = get_store()
         store.save_conversation(profile.model_dump(), st.session_state.messages, st.session_state.questions)
 
 
+def _cached_export(name: str, ver: int, build: Callable[[], bytes]) -> bytes:
+    cache = st.session_state.export_cache
+    hit = cache.get(name)
+    if hit is not None and hit[0] == ver:
+        return hit[1]
+    data = build()
+    cache[name] = (ver, data)
+    return data
+
+
 def _export_profile_json() -> bytes:
-    profile = st.session_state.profile
-    return json.dumps(profile, ensure_ascii=False, indent=2).encode("utf-8")
+    return dumps_json(st.session_state.profile, indent=True)
+
+
+def _csv_field(value: Any) -> str:
+    return '"' + str(value).replace('"', '""') + '"'
 
 
 def _export_qa_csv() -> bytes:
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["idx", "tech", "question", "answer", "sentiment"])
+    rows = ["idx,tech,question,answer,sentiment"]
     for idx, q in enumerate(st.session_state.questions, start=1):
-        writer.writerow([idx, q.get("tech", ""), q.get("question", ""), q.get("answer", ""), q.get("sentiment", "")])
-    return output.getvalue().encode("utf-8")
+        rows.append(
+            str(idx) + "," + ",".join(_csv_field(q.get(k, "")) for k in ("tech", "question", "answer", "sentiment"))
+        )
+    return ("\r\n".join(rows) + "\r\n").encode("utf-8")
+
+
+def _history_for_llm() -> List[Dict[str, Any]]:
+    messages = st.session_state.messages
+    cutoff = max(0, len(messages) - RECENT_MESSAGES)
+    if cutoff > st.session_state.summarized_upto:
+        # Only the assistant's own turns are summarized: user turns hold the
+        # candidate's contact details and must not be replayed as context.
+        lines = [
+            m["content"]
+            for m in messages[st.session_state.summarized_upto:cutoff]
+            if m["role"] == "assistant"
+        ]
+        summary = "\n".join(filter(None, [st.session_state.history_summary, *lines]))
+        st.session_state.history_summary = summary[-SUMMARY_CHAR_BUDGET:]
+        st.session_state.summarized_upto = cutoff
+    recent = messages[cutoff:]
+    if not st.session_state.history_summary:
+        return recent
+    return [{"role": "assistant", "content": "Prior context: " + st.session_state.history_summary}] + recent
 
 
 def main() -> None:
     st.set_page_config(page_title=APP_TITLE, page_icon="🤝", layout="centered")
     init_state()
+    # Streamlit clears the page on every rerun, so history is drawn once per
+    # run and later render_chat calls only append what was added since.
+    st.session_state.rendered_upto = 0
 
     st.title(APP_TITLE)
 
     with st.sidebar:
         st.subheader("Settings")
-        st.write("Conversation end keywords: " + ", ".join(sorted(END_KEYWORDS)))
+        st.write("Conversation end keywords: " + ", ".join(sorted(END_WORDS_DEFAULT)))
         st.write("LLM Provider: OpenAI (if OPENAI_API_KEY set) or rule-based fallback")
         st.toggle("Consent to local storage", key="consent")
         st.session_state.question_count = st.slider("Number of technical questions", min_value=3, max_value=8, value=st.session_state.question_count)
@@ -199,9 +266,9 @@ def main() -> None:
         st.subheader("Exports")
         col1, col2 = st.columns(2)
         with col1:
-            st.download_button("Download Profile (JSON)", _export_profile_json(), file_name="profile.json", mime="application/json")
+            st.download_button("Download Profile (JSON)", _cached_export("profile", st.session_state.profile_ver, _export_profile_json), file_name="profile.json", mime="application/json")
         with col2:
-            st.download_button("Download Q&A (CSV)", _export_qa_csv(), file_name="qa.csv", mime="text/csv")
+            st.download_button("Download Q&A (CSV)", _cached_export("qa", st.session_state.questions_ver, _export_qa_csv), file_name="qa.csv", mime="text/csv")
 
     greeting_block()
     render_chat()
@@ -214,7 +281,7 @@ def main() -> None:
     if not user_input:
         return
 
-    if is_end_keyword(user_input, END_KEYWORDS):
+    if is_end_keyword(user_input):
         add_message("user", user_input)
         end_conversation_block(maybe_finalize_profile())
         render_chat()
@@ -235,8 +302,10 @@ def main() -> None:
     if profile and not st.session_state.questions:
         questions = ask_technical_questions(profile)
         st.session_state.questions = questions
+        st.session_state.next_q = 0
+        st.session_state.questions_ver += 1
         intro = (
-            f"Generating questions for your tech stack: {', '.join(parse_tech_stack(profile.tech_stack))}. "
+            f"Generating questions for your tech stack: {', '.join(_parsed_techs(profile))}. "
             f"Please answer briefly."
         )
         add_message("assistant", intro)
@@ -245,27 +314,29 @@ def main() -> None:
         render_chat()
         return
 
-    unanswered = [q for q in st.session_state.questions if "answer" not in q]
-    if unanswered:
-        current = unanswered[0]
+    idx = st.session_state.next_q
+    if idx < len(st.session_state.questions):
+        current = st.session_state.questions[idx]
         current["answer"] = user_input
         current["sentiment"] = analyze_sentiment_label(user_input)
-        remaining = len([q for q in st.session_state.questions if "answer" not in q])
+        st.session_state.next_q += 1
+        st.session_state.questions_ver += 1
+        remaining = len(st.session_state.questions) - st.session_state.next_q
         add_message("assistant", "Noted. " + (f"{remaining} question(s) remaining." if remaining else "Type 'exit' to finish or ask a follow-up."))
         render_chat()
         return
 
     llm = get_llm_client()
-    assistant_reply = llm.chat(
-        system_prompt=(
-            "You are a hiring assistant for a tech recruitment agency. Keep answers concise,"
-            " stay within hiring and tech-screening topics only. If asked unrelated questions,"
-            " politely refuse and redirect to hiring-related topics."
-        ),
-        messages=st.session_state.messages[-10:],
-    )
-    add_message("assistant", assistant_reply)
     render_chat()
+    with st.chat_message("assistant"):
+        assistant_reply = st.write_stream(
+            llm.stream(
+                system_prompt=SYSTEM_PROMPT,
+                messages=_history_for_llm(),
+            )
+        )
+    add_message("assistant", assistant_reply)
+    st.session_state.rendered_upto = len(st.session_state.messages)
 
 
 if __name__ == "__main__":
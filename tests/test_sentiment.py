@@ -0,0 +1,53 @@
+import pytest
+
+pytest.importorskip("nltk")
+
+from nltk.sentiment import SentimentIntensityAnalyzer  # noqa: E402
+
+from app.utils import sentiment  # noqa: E402
+
+
+pytestmark = pytest.mark.skipif(not sentiment._LEXICON, reason="VADER lexicon not installed")
+
+SAMPLES = [
+    "I love Python, it is great!",
+    "The project was a failure but we learned a lot",
+    "kind of good",
+    "It is very good",
+    "Great!!!",
+    "The GIL prevents true parallelism, which is bad for CPU bound threads but fine for IO",
+    "no problem",
+    "This is not good",
+    "I am not sure, it was terrible :(",
+    "I really REALLY hate flaky tests",
+    "Is this good??",
+    "at least it works",
+    "least favorite",
+    "never so happy",
+    "sort of okay but very slow",
+    "yeah right, great idea",
+    "Generators yield values lazily.",
+]
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return SentimentIntensityAnalyzer()
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_compound_matches_vader(reference, text):
+    expected = reference.polarity_scores(text)["compound"]
+    assert round(sentiment._compound(text), 4) == pytest.approx(expected, abs=1e-4)
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_label_matches_vader(reference, text):
+    compound = reference.polarity_scores(text)["compound"]
+    expected = "positive" if compound >= 0.2 else "negative" if compound <= -0.2 else "neutral"
+    assert sentiment.analyze_sentiment_label(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "   ", "!", "42", "?!"])
+def test_trivial_inputs_are_neutral(text):
+    assert sentiment.analyze_sentiment_label(text) == "neutral"